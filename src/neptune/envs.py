@@ -28,6 +28,7 @@ __all__ = [
     "NEPTUNE_ASYNC_BATCH_SIZE",
     "NEPTUNE_SUBPROCESS_KILL_TIMEOUT",
     "NEPTUNE_FETCH_TABLE_STEP_SIZE",
+    "NEPTUNE_FETCH_TABLE_MAX_WORKERS",
     "NEPTUNE_SYNC_AFTER_STOP_TIMEOUT",
     "NEPTUNE_REQUEST_TIMEOUT",
     "NEPTUNE_MAX_DISK_UTILIZATION",
@@ -65,6 +66,8 @@ NEPTUNE_SUBPROCESS_KILL_TIMEOUT = "NEPTUNE_SUBPROCESS_KILL_TIMEOUT"
 
 NEPTUNE_FETCH_TABLE_STEP_SIZE = "NEPTUNE_FETCH_TABLE_STEP_SIZE"
 
+NEPTUNE_FETCH_TABLE_MAX_WORKERS = "NEPTUNE_FETCH_TABLE_MAX_WORKERS"
+
 NEPTUNE_SYNC_AFTER_STOP_TIMEOUT = "NEPTUNE_SYNC_AFTER_STOP_TIMEOUT"
 
 NEPTUNE_ASYNC_BATCH_SIZE = "NEPTUNE_ASYNC_BATCH_SIZE"
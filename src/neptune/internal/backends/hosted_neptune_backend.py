@@ -20,10 +20,12 @@ import logging
 import os
 import re
 import typing
+from concurrent.futures import ThreadPoolExecutor
 from typing import (
     TYPE_CHECKING,
     Any,
     Dict,
+    Generator,
     Iterable,
     List,
     Optional,
@@ -46,7 +48,10 @@ from neptune.common.exceptions import (
     NeptuneException,
 )
 from neptune.common.patterns import PROJECT_QUALIFIED_NAME_PATTERN
-from neptune.envs import NEPTUNE_FETCH_TABLE_STEP_SIZE
+from neptune.envs import (
+    NEPTUNE_FETCH_TABLE_MAX_WORKERS,
+    NEPTUNE_FETCH_TABLE_STEP_SIZE,
+)
 from neptune.exceptions import (
     AmbiguousProjectName,
     ContainerUUIDNotFound,
@@ -1014,14 +1019,13 @@ class HostedNeptuneBackend(NeptuneBackend):
         except HTTPNotFound:
             raise FetchAttributeNotFoundException(path_to_str(path))
 
-    @with_api_exceptions_handler
     def search_leaderboard_entries(
         self,
         project_id: UniqueId,
         types: Optional[Iterable[ContainerType]] = None,
         query: Optional[NQLQuery] = None,
         columns: Optional[Iterable[str]] = None,
-    ) -> List[LeaderboardEntry]:
+    ) -> Generator[LeaderboardEntry, None, None]:
         if query:
             query_params = {"query": {"query": str(query)}}
         else:
@@ -1031,36 +1035,59 @@ class HostedNeptuneBackend(NeptuneBackend):
         else:
             attributes_filter = {}
 
+        @with_api_exceptions_handler
         def get_portion(limit, offset):
-            return (
-                self.leaderboard_client.api.searchLeaderboardEntries(
-                    projectIdentifier=project_id,
-                    type=list(map(lambda container_type: container_type.to_api(), types)),
-                    params={
-                        **query_params,
-                        **attributes_filter,
-                        "pagination": {"limit": limit, "offset": offset},
-                    },
-                    **DEFAULT_REQUEST_KWARGS,
+            try:
+                result = (
+                    self.leaderboard_client.api.searchLeaderboardEntries(
+                        projectIdentifier=project_id,
+                        type=list(map(lambda container_type: container_type.to_api(), types)),
+                        params={
+                            **query_params,
+                            **attributes_filter,
+                            "pagination": {"limit": limit, "offset": offset},
+                        },
+                        **DEFAULT_REQUEST_KWARGS,
+                    )
+                    .response()
+                    .result
                 )
-                .response()
-                .result.entries
-            )
+            except HTTPNotFound:
+                raise ProjectNotFound(project_id)
+            return result.entries, getattr(result, "matchingItemCount", None)
+
+        # paths, tags, owners and states repeat across entries, keep a single copy of each of them
+        strings: Dict[str, str] = {}
+
+        def deduplicate(value: str) -> str:
+            return strings.setdefault(value, value)
+
+        # resolved once per search instead of once per attribute of every entry
+        supported_attribute_types = {item.value: (item, "{}Properties".format(item.value)) for item in AttributeType}
 
         def to_leaderboard_entry(entry) -> LeaderboardEntry:
-            supported_attribute_types = {item.value for item in AttributeType}
             attributes: List[AttributeWithProperties] = []
             for attr in entry.attributes:
-                if attr.type in supported_attribute_types:
-                    properties = attr.__getitem__("{}Properties".format(attr.type))
-                    attributes.append(AttributeWithProperties(attr.name, AttributeType(attr.type), properties))
+                supported_attribute_type = supported_attribute_types.get(attr.type)
+                if supported_attribute_type is None:
+                    continue
+                attribute_type, properties_name = supported_attribute_type
+                properties = attr.__getitem__(properties_name)
+                if attribute_type is AttributeType.STRING_SET:
+                    properties.values = [deduplicate(value) for value in properties.values]
+                elif attribute_type is AttributeType.STRING or attribute_type is AttributeType.RUN_STATE:
+                    properties.value = deduplicate(properties.value)
+                attributes.append(AttributeWithProperties(deduplicate(attr.name), attribute_type, properties))
             return LeaderboardEntry(entry.experimentId, attributes)
 
-        try:
-            step_size = int(os.getenv(NEPTUNE_FETCH_TABLE_STEP_SIZE, "100"))
-            return [to_leaderboard_entry(e) for e in self._get_all_items(get_portion, step=step_size)]
-        except HTTPNotFound:
-            raise ProjectNotFound(project_id)
+        step_size = int(os.getenv(NEPTUNE_FETCH_TABLE_STEP_SIZE, "100"))
+        max_workers = int(os.getenv(NEPTUNE_FETCH_TABLE_MAX_WORKERS, "8"))
+        # the first page is requested right away, so errors like a missing project are raised by the search itself
+        first_portion = get_portion(limit=step_size, offset=0)
+        return (
+            to_leaderboard_entry(entry)
+            for entry in self._iter_all_items(get_portion, first_portion, step=step_size, max_workers=max_workers)
+        )
 
     def get_run_url(self, run_id: str, workspace: str, project_name: str, sys_id: str) -> str:
         base_url = self.get_display_address()
@@ -1086,11 +1113,28 @@ class HostedNeptuneBackend(NeptuneBackend):
         return f"{base_url}/{workspace}/{project_name}/m/{model_id}/v/{sys_id}"
 
     @staticmethod
-    def _get_all_items(get_portion, step):
+    def _iter_all_items(get_portion, first_portion, step, max_workers=1):
         max_server_offset = 10000
-        items = []
-        previous_items = None
-        while (previous_items is None or len(previous_items) >= step) and len(items) < max_server_offset:
-            previous_items = get_portion(limit=step, offset=len(items))
-            items += previous_items
-        return items
+        items, total_count = first_portion
+        yield from items
+
+        if len(items) < step:
+            return
+
+        if not isinstance(total_count, int) or max_workers <= 1:
+            offset = len(items)
+            while len(items) >= step and offset < max_server_offset:
+                items, _ = get_portion(limit=step, offset=offset)
+                offset += len(items)
+                yield from items
+            return
+
+        # the number of pages is known upfront, so fetch up to `max_workers` of them at once, keeping their order;
+        # every window gets its own executor, so no threads are held while the caller isn't reading
+        offsets = range(step, min(total_count, max_server_offset), step)
+        for window_start in range(0, len(offsets), max_workers):
+            window = offsets[window_start : window_start + max_workers]
+            with ThreadPoolExecutor(max_workers=len(window)) as executor:
+                portions = list(executor.map(lambda offset: get_portion(limit=step, offset=offset), window))
+            for items, _ in portions:
+                yield from items
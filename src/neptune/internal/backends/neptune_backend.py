@@ -18,6 +18,7 @@ __all__ = ["NeptuneBackend"]
 import abc
 from typing import (
     Any,
+    Iterable,
     List,
     Optional,
     Tuple,
@@ -303,7 +304,7 @@ class NeptuneBackend:
         types: Optional[List[ContainerType]] = None,
         query: Optional[NQLQuery] = None,
         columns: Optional[List[str]] = None,
-    ) -> List[LeaderboardEntry]:
+    ) -> Iterable[LeaderboardEntry]:
         pass
 
     @abc.abstractmethod
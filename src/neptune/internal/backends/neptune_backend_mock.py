@@ -542,8 +542,9 @@ class NeptuneBackendMock(NeptuneBackend):
         types: Optional[Iterable[ContainerType]] = None,
         query: Optional[NQLQuery] = None,
         columns: Optional[Iterable[str]] = None,
-    ) -> List[LeaderboardEntry]:
+    ) -> Iterable[LeaderboardEntry]:
         """Non relevant for mock"""
+        return []
 
     class AttributeTypeConverterValueVisitor(ValueVisitor[AttributeType]):
         def visit_float(self, _: Float) -> AttributeType:
@@ -19,8 +19,10 @@ import base64
 import json
 import os
 from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
 from typing import (
-    Dict,
+    Mapping,
     Optional,
 )
 
@@ -63,8 +65,10 @@ class Credentials:
         )
 
     @staticmethod
-    def _api_token_to_dict(api_token: str) -> Dict[str, str]:
+    @lru_cache(maxsize=16)
+    def _api_token_to_dict(api_token: str) -> Mapping[str, str]:
+        # decoded once per token (e.g. the anonymous one), read-only as it's shared between callers
         try:
-            return json.loads(base64.b64decode(api_token.encode()).decode("utf-8"))
+            return MappingProxyType(json.loads(base64.b64decode(api_token.encode()).decode("utf-8")))
         except Exception:
             raise NeptuneInvalidApiTokenException()
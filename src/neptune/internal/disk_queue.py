@@ -23,6 +23,7 @@ import threading
 from dataclasses import dataclass
 from glob import glob
 from pathlib import Path
+from time import monotonic
 from typing import (
     Callable,
     Generic,
@@ -41,6 +42,9 @@ T = TypeVar("T")
 
 _logger = logging.getLogger(__name__)
 
+# operations serialize to plain trees of dicts, lists and scalars, so checking for cycles is not needed
+_json_encoder = json.JSONEncoder(check_circular=False)
+
 
 @dataclass
 class QueueElement(Generic[T]):
@@ -52,6 +56,8 @@ class QueueElement(Generic[T]):
 class DiskQueue(Generic[T]):
     # NOTICE: This class is thread-safe as long as there is only one consumer and one producer.
     DEFAULT_MAX_BATCH_SIZE_BYTES = 100 * 1024**2
+    MAX_PENDING_OPERATIONS = 128
+    MAX_PENDING_TIME_SECONDS = 0.05
 
     def __init__(
         self,
@@ -87,23 +93,48 @@ class DiskQueue(Generic[T]):
         self._file_size = 0
         self._should_skip_to_ack = True
 
+        # operations are written to the log and `last_put_version` in batches rather than one by one
+        self._last_put_version: int = self._last_put_file.read_local()
+        self._pending: List[Tuple[int, str]] = []
+        self._pending_since: float = 0.0
+        self._pending_lock = threading.Lock()
+
         self._empty_cond = threading.Condition(lock)
 
     def put(self, obj: T) -> int:
-        version = self._last_put_file.read_local() + 1
-        _json = json.dumps(self._serialize(obj, version))
-        if self._file_size + len(_json) > self._max_file_size:
-            old_writer = self._writer
-            self._writer = open(self._get_log_file(version), "a")
-            old_writer.flush()
-            old_writer.close()
-            self._file_size = 0
-            self._write_file_version = version
-        self._writer.write(_json + "\n")
-        self._last_put_file.write(version)
-        self._file_size += len(_json) + 1
+        with self._pending_lock:
+            version = self._last_put_version + 1
+            _json = _json_encoder.encode(self._serialize(obj, version))
+            if not self._pending:
+                self._pending_since = monotonic()
+            self._pending.append((version, _json))
+            self._last_put_version = version
+            if (
+                len(self._pending) >= self.MAX_PENDING_OPERATIONS
+                or monotonic() - self._pending_since >= self.MAX_PENDING_TIME_SECONDS
+            ):
+                self._write_pending()
         return version
 
+    def _write_pending(self) -> None:
+        # Caller is responsible for taking `_pending_lock`
+        if not self._pending:
+            return
+        for version, _json in self._pending:
+            if self._file_size + len(_json) > self._max_file_size:
+                old_writer = self._writer
+                self._writer = open(self._get_log_file(version), "a")
+                old_writer.flush()
+                old_writer.close()
+                self._file_size = 0
+                self._write_file_version = version
+            self._writer.write(_json + "\n")
+            self._file_size += len(_json) + 1
+        # data has to reach the file before the version pointing at it does
+        self._writer.flush()
+        self._last_put_file.write(self._pending[-1][0])
+        self._pending.clear()
+
     def get(self) -> Optional[QueueElement[T]]:
         if self._should_skip_to_ack:
             return self._skip_and_get()
@@ -164,11 +195,15 @@ class DiskQueue(Generic[T]):
         return ret
 
     def flush(self):
-        self._writer.flush()
+        with self._pending_lock:
+            self._write_pending()
+            self._writer.flush()
         self._last_ack_file.flush()
         self._last_put_file.flush()
 
     def close(self):
+        with self._pending_lock:
+            self._write_pending()
         self._reader.close()
         self._writer.close()
         self._last_ack_file.close()
@@ -215,7 +250,7 @@ class DiskQueue(Generic[T]):
         return self.size() == 0
 
     def size(self) -> int:
-        return self._last_put_file.read_local() - self._last_ack_file.read_local()
+        return self._last_put_version - self._last_ack_file.read_local()
 
     def _get_log_file(self, index: int) -> str:
         return "{}/data-{}.log".format(self._dir_path, index)
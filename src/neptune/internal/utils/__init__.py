@@ -64,16 +64,16 @@ def replace_patch_version(version: str):
 
 
 def verify_type(var_name: str, var, expected_type: Union[type, tuple]):
-    try:
-        if isinstance(expected_type, tuple):
-            type_name = " or ".join(get_type_name(t) for t in expected_type)
-        else:
-            type_name = get_type_name(expected_type)
-    except Exception as e:
-        # Just to be sure that nothing weird will be raised here
-        raise TypeError("Incorrect type of {}".format(var_name)) from e
-
     if not isinstance(var, expected_type):
+        try:
+            if isinstance(expected_type, tuple):
+                type_name = " or ".join(get_type_name(t) for t in expected_type)
+            else:
+                type_name = get_type_name(expected_type)
+        except Exception as e:
+            # Just to be sure that nothing weird will be raised here
+            raise TypeError("Incorrect type of {}".format(var_name)) from e
+
         raise TypeError("{} must be a {} (was {})".format(var_name, type_name, type(var)))
 
     if isinstance(var, IOBase) and not hasattr(var, "read"):
@@ -185,10 +185,13 @@ def is_ipython() -> bool:
 
 
 def as_list(name: str, value: Optional[Union[str, Iterable[str]]]) -> Optional[Iterable[str]]:
-    verify_type(name, value, (type(None), str, Iterable))
     if value is None:
         return []
     if isinstance(value, str):
         return [value]
-    verify_collection_type(name, value, str)
+    if __debug__:
+        verify_collection_type(name, value, str)
+    else:
+        # skip checking every element of (possibly long) collections in optimized mode
+        verify_type(name, value, (list, set, tuple))
     return value
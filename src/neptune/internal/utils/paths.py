@@ -15,15 +15,26 @@
 #
 __all__ = ["parse_path", "path_to_str", "join_paths"]
 
-from typing import List
+from functools import lru_cache
+from typing import (
+    List,
+    Tuple,
+)
 
 
 def _remove_empty_paths(paths: List[str]) -> List[str]:
     return list(filter(bool, paths))
 
 
+@lru_cache(maxsize=4096)
+def _parse_path(path: str) -> Tuple[str, ...]:
+    return tuple(filter(bool, path.split("/")))
+
+
 def parse_path(path: str) -> List[str]:
-    return _remove_empty_paths(path.split("/"))
+    # the same few paths are parsed over and over (e.g. `run["train/loss"].append(...)` in a loop);
+    # return a fresh list so that callers can't modify the cached value
+    return list(_parse_path(path))
 
 
 def path_to_str(path: List[str]) -> str:
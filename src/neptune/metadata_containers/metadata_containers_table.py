@@ -15,11 +15,15 @@
 #
 __all__ = ["Table"]
 
+import itertools
 import logging
+import threading
 from datetime import datetime
 from typing import (
     Any,
     Dict,
+    Iterable,
+    Iterator,
     List,
     Optional,
     Union,
@@ -157,22 +161,76 @@ class Table:
         self,
         backend: NeptuneBackend,
         container_type: ContainerType,
-        entries: List[LeaderboardEntry],
+        entries: Iterable[LeaderboardEntry],
     ):
         self._backend = backend
-        self._entries = entries
         self._container_type = container_type
+        # entries are pulled from the backend lazily and kept, so the table can be read more than once
+        self._entries: List[LeaderboardEntry] = []
+        self._entries_iterator: Optional[Iterator[LeaderboardEntry]] = iter(entries)
+        # the same table may be read from many threads (e.g. when reused by `Project.fetch_runs_table`)
+        self._entries_lock = threading.Lock()
+        # a stream that failed midway can't be told apart from a finished one, so its error is kept and re-raised
+        self._entries_error: Optional[Exception] = None
+
+    def _fetch_entries(self, count: Optional[int] = None) -> None:
+        if count is not None and count <= len(self._entries):
+            return
+        with self._entries_lock:
+            if self._entries_error is not None:
+                raise self._entries_error
+            if self._entries_iterator is None:
+                return
+            try:
+                if count is None:
+                    self._entries.extend(self._entries_iterator)
+                    self._entries_iterator = None
+                    return
+                missing = count - len(self._entries)
+                if missing > 0:
+                    self._entries.extend(itertools.islice(self._entries_iterator, missing))
+                    if len(self._entries) < count:
+                        self._entries_iterator = None
+            except Exception as e:
+                self._entries_error = e
+                self._entries_iterator = None
+                raise
+
+    def _iter_entries(self) -> Iterator[LeaderboardEntry]:
+        index = 0
+        while True:
+            self._fetch_entries(index + 1)
+            if index >= len(self._entries):
+                return
+            yield self._entries[index]
+            index += 1
+
+    def _to_table_entry(self, entry: LeaderboardEntry) -> TableEntry:
+        return TableEntry(
+            backend=self._backend,
+            container_type=self._container_type,
+            _id=entry.id,
+            attributes=entry.attributes,
+        )
+
+    def __iter__(self) -> Iterator[TableEntry]:
+        return map(self._to_table_entry, self._iter_entries())
+
+    def __getitem__(self, item: Union[int, slice]) -> Union[TableEntry, List[TableEntry]]:
+        if isinstance(item, slice):
+            if item.stop is None or item.stop < 0 or (item.start or 0) < 0 or (item.step or 1) < 0:
+                self._fetch_entries()
+            else:
+                self._fetch_entries(item.stop)
+            return [self._to_table_entry(entry) for entry in self._entries[item]]
+        if item < 0:
+            self._fetch_entries()
+        else:
+            self._fetch_entries(item + 1)
+        return self._to_table_entry(self._entries[item])
 
     def to_rows(self) -> List[TableEntry]:
-        return [
-            TableEntry(
-                backend=self._backend,
-                container_type=self._container_type,
-                _id=e.id,
-                attributes=e.attributes,
-            )
-            for e in self._entries
-        ]
+        return list(self)
 
     def to_pandas(self):
         import pandas as pd
@@ -212,16 +270,6 @@ class Table:
             )
             return None
 
-        def make_row(
-            entry: LeaderboardEntry,
-        ) -> Dict[str, Optional[Union[str, float, datetime]]]:
-            row: Dict[str, Union[str, float, datetime]] = dict()
-            for attr in entry.attributes:
-                value = make_attribute_value(attr)
-                if value is not None:
-                    row[attr.path] = value
-            return row
-
         def sort_key(attr):
             domain = attr.split("/")[0]
             if domain == "sys":
@@ -230,8 +278,34 @@ class Table:
                 return 2, attr
             return 1, attr
 
-        rows = dict((n, make_row(entry)) for (n, entry) in enumerate(self._entries))
+        # all rows are needed anyway, so each column can be allocated at its final size up front
+        # and padded for rows without a value the same way `from_dict` would
+        self._fetch_entries()
+        row_count = len(self._entries)
+        missing = float("nan")
+        columns: Dict[str, List[Optional[Union[str, float, datetime]]]] = dict()
+        rows_with_values: List[int] = []
+        for row, entry in enumerate(self._entries):
+            has_values = False
+            for attr in entry.attributes:
+                value = make_attribute_value(attr)
+                if value is not None:
+                    column = columns.get(attr.path)
+                    if column is None:
+                        column = columns[attr.path] = [missing] * row_count
+                    column[row] = value
+                    has_values = True
+            if has_values:
+                rows_with_values.append(row)
+
+        # like `from_dict`, leave out entries without any value, keeping the positions of the others as the index
+        if len(rows_with_values) < row_count:
+            return pd.DataFrame(
+                data={path: [columns[path][row] for row in rows_with_values] for path in sorted(columns, key=sort_key)},
+                index=pd.Index(rows_with_values, dtype="int64"),
+            )
 
-        df = pd.DataFrame.from_dict(data=rows, orient="index")
-        df = df.reindex(sorted(df.columns, key=sort_key), axis="columns")
-        return df
+        return pd.DataFrame(
+            data={path: columns[path] for path in sorted(columns, key=sort_key)},
+            index=pd.RangeIndex(row_count),
+        )
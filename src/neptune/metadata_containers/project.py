@@ -16,9 +16,14 @@
 __all__ = ["Project"]
 
 import os
+import threading
+import weakref
+from collections import OrderedDict
+from time import monotonic
 from typing import (
     Iterable,
     Optional,
+    Tuple,
     Union,
 )
 
@@ -52,6 +57,9 @@ from neptune.metadata_containers.metadata_containers_table import Table
 from neptune.metadata_containers.safe_container import safe_function
 from neptune.types.mode import Mode
 
+RUNS_TABLE_CACHE_TTL = 60  # seconds
+RUNS_TABLE_CACHE_SIZE = 16
+
 
 class Project(MetadataContainer):
     """Class for tracking and retrieving project-level metadata of a neptune.ai project."""
@@ -156,6 +164,10 @@ class Project(MetadataContainer):
         if mode == Mode.OFFLINE:
             raise NeptuneException("Project can't be initialized in OFFLINE mode")
 
+        # only weak references are kept, so a table (with all the entries it has loaded) is freed once callers drop it
+        self._runs_table_cache: "OrderedDict[tuple, Tuple[float, weakref.ref[Table]]]" = OrderedDict()
+        self._runs_table_cache_lock = threading.Lock()
+
         super().__init__(
             project=project,
             api_token=api_token,
@@ -281,6 +293,7 @@ class Project(MetadataContainer):
         tag: Optional[Union[str, Iterable[str]]] = None,
         columns: Optional[Iterable[str]] = None,
         trashed: Optional[bool] = False,
+        force_refresh: bool = False,
     ) -> Table:
         """Retrieve runs matching the specified criteria.
 
@@ -312,6 +325,10 @@ class Project(MetadataContainer):
                 If `True`, only trashed runs are retrieved.
                 If `False` (default), only not-trashed runs are retrieved.
                 If `None`, both trashed and not-trashed runs are retrieved.
+            force_refresh: Whether to bypass the local cache of recently fetched tables.
+                Tables fetched with the same criteria within the last minute are reused by default,
+                as long as they're still referenced elsewhere.
+                If `True`, the table is always fetched from the server.
 
         Returns:
             `Table` object containing `Run` objects matching the specified criteria.
@@ -357,18 +374,71 @@ class Project(MetadataContainer):
         ids = as_list("id", id)
         states = as_list("state", state)
         owners = as_list("owner", owner)
-        tags = as_list("tag", tag)
+        # every tag has to match anyway, so repeating one only adds a redundant clause to the query
+        tags = list(dict.fromkeys(as_list("tag", tag)))
 
         verify_type("trashed", trashed, (bool, type(None)))
+        verify_type("force_refresh", force_refresh, bool)
+        if columns is not None:
+            # used for both the cache key and the query
+            columns = list(columns)
+
+        cache_key = (
+            frozenset(ids),
+            frozenset(states),
+            frozenset(owners),
+            frozenset(tags),
+            trashed,
+            tuple(sorted(columns)) if columns is not None else None,
+        )
+        if not force_refresh:
+            table = self._get_cached_runs_table(cache_key)
+            if table is not None:
+                return table
 
         nql_query = self._prepare_nql_query(ids, states, owners, tags, trashed)
 
-        return MetadataContainer._fetch_entries(
+        table = MetadataContainer._fetch_entries(
             self,
             child_type=ContainerType.RUN,
             query=nql_query,
             columns=columns,
         )
+        self._cache_runs_table(cache_key, table)
+        return table
+
+    def _get_cached_runs_table(self, cache_key: tuple) -> Optional[Table]:
+        with self._runs_table_cache_lock:
+            self._drop_stale_runs_tables()
+            cached = self._runs_table_cache.get(cache_key)
+            if cached is None:
+                return None
+            _, table_ref = cached
+            table = table_ref()
+            if table is None:
+                del self._runs_table_cache[cache_key]
+                return None
+            self._runs_table_cache.move_to_end(cache_key)
+            return table
+
+    def _cache_runs_table(self, cache_key: tuple, table: Table) -> None:
+        with self._runs_table_cache_lock:
+            self._drop_stale_runs_tables()
+            self._runs_table_cache[cache_key] = (monotonic(), weakref.ref(table))
+            self._runs_table_cache.move_to_end(cache_key)
+            while len(self._runs_table_cache) > RUNS_TABLE_CACHE_SIZE:
+                self._runs_table_cache.popitem(last=False)
+
+    def _drop_stale_runs_tables(self) -> None:
+        now = monotonic()
+        stale = []
+        for key, (fetched_at, table_ref) in self._runs_table_cache.items():
+            table = table_ref()
+            # a table whose entries failed to load would only raise the same error again
+            if now - fetched_at > RUNS_TABLE_CACHE_TTL or table is None or table._entries_error is not None:
+                stale.append(key)
+        for key in stale:
+            del self._runs_table_cache[key]
 
     @safe_function()
     def fetch_models_table(self, *, columns: Optional[Iterable[str]] = None, trashed: Optional[bool] = False) -> Table:
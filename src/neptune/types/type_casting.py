@@ -52,8 +52,31 @@ from neptune.types.series.series import Series
 from neptune.types.value import Value
 from neptune.types.value_copy import ValueCopy
 
+try:
+    from numpy import floating as numpy_floating
+    from numpy import integer as numpy_integer
+except ImportError:
+    numpy_floating = None
+    numpy_integer = None
+
+# values of exactly these types can't match any earlier check of `cast_value`, so they can skip the whole chain
+_BUILTIN_TYPE_CASTS = {
+    bool: Boolean,
+    int: Integer,
+    float: Float,
+    str: String,
+    datetime: Datetime,
+}
+
 
 def cast_value(value: Any) -> Optional[Value]:
+    builtin_type_cast = _BUILTIN_TYPE_CASTS.get(type(value))
+    if builtin_type_cast is not None:
+        return builtin_type_cast(value)
+    # numpy scalars would otherwise fall through almost the whole chain before ending up as floats
+    if numpy_floating is not None and isinstance(value, (numpy_floating, numpy_integer)):
+        return Float(value)
+
     from neptune.handler import Handler
 
     from_stringify_value = False
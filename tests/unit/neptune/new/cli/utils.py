@@ -63,6 +63,7 @@ def _prepare_disk_queue(*, exp_path, last_ack_version):
     queue.put("op-0")
     queue.put("op-1")
     queue.put("op-2")
+    queue.close()
 
     SyncOffsetFile(exp_path / "last_put_version").write(3)
     if last_ack_version is not None:
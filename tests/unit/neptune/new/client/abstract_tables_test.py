@@ -14,8 +14,10 @@
 # limitations under the License.
 #
 import os
+import time
 import uuid
 from abc import abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import List
 
@@ -25,6 +27,7 @@ from mock import (
 )
 
 from neptune import ANONYMOUS_API_TOKEN
+from neptune.common.exceptions import NeptuneConnectionLostException
 from neptune.envs import (
     API_TOKEN_ENV_NAME,
     PROJECT_ENV_NAME,
@@ -109,12 +112,16 @@ class AbstractTablesTestMixin:
         # and
         empty_entry = LeaderboardEntry(str(uuid.uuid4()), [])
         filled_entry = LeaderboardEntry(str(uuid.uuid4()), attributes)
-        search_leaderboard_entries.return_value = [empty_entry, filled_entry]
+        partial_entry = LeaderboardEntry(str(uuid.uuid4()), [attr for attr in attributes if attr.path == "float"])
+        search_leaderboard_entries.return_value = [empty_entry, filled_entry, partial_entry]
 
         # when
         df = self.get_table().to_pandas()
 
         # then
+        self.assertEqual([1, 2], list(df.index))
+        self.assertEqual(12.5, df["float"][2])
+        self.assertTrue(df["string"].isna()[2])
         self.assertEqual("Inactive", df["run/state"][1])
         self.assertEqual(12.5, df["float"][1])
         self.assertEqual("some text", df["string"][1])
@@ -131,6 +138,70 @@ class AbstractTablesTestMixin:
         with self.assertRaises(KeyError):
             self.assertTrue(df["image/series"])
 
+    @patch.object(NeptuneBackendMock, "search_leaderboard_entries")
+    def test_get_table_entries_lazily(self, search_leaderboard_entries):
+        # given
+        fetched_ids = []
+
+        def entries():
+            for _ in range(3):
+                entry = LeaderboardEntry(str(uuid.uuid4()), [])
+                fetched_ids.append(entry.id)
+                yield entry
+
+        search_leaderboard_entries.return_value = entries()
+
+        # when
+        table = self.get_table()
+
+        # then
+        self.assertEqual([], fetched_ids)
+        first_entry = table[0]
+        self.assertEqual(fetched_ids, [first_entry._id])
+        second_entry = table[1:2][0]
+        self.assertEqual(fetched_ids, [first_entry._id, second_entry._id])
+        self.assertEqual(fetched_ids, [entry._id for entry in self.get_table_entries(table)])
+        self.assertEqual(fetched_ids, [entry._id for entry in self.get_table_entries(table)])
+
+    @patch.object(NeptuneBackendMock, "search_leaderboard_entries")
+    def test_get_table_entries_from_many_threads(self, search_leaderboard_entries):
+        # given
+        def entries():
+            for _ in range(20):
+                time.sleep(0.001)
+                yield LeaderboardEntry(str(uuid.uuid4()), [])
+
+        search_leaderboard_entries.return_value = entries()
+        table = self.get_table()
+
+        # when
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(lambda _: [entry._id for entry in table], range(4)))
+
+        # then
+        self.assertEqual(20, len(results[0]))
+        for result in results[1:]:
+            self.assertEqual(results[0], result)
+
+    @patch.object(NeptuneBackendMock, "search_leaderboard_entries")
+    def test_get_table_entries_after_failed_fetch(self, search_leaderboard_entries):
+        # given
+        def entries():
+            for _ in range(3):
+                yield LeaderboardEntry(str(uuid.uuid4()), [])
+            raise NeptuneConnectionLostException(ConnectionError())
+
+        search_leaderboard_entries.return_value = entries()
+        table = self.get_table()
+
+        # expect
+        self.assertIsNotNone(table[2])
+        for _ in range(2):
+            with self.assertRaises(NeptuneConnectionLostException):
+                self.get_table_entries(table)
+            with self.assertRaises(NeptuneConnectionLostException):
+                table.to_pandas()
+
     @patch.object(NeptuneBackendMock, "search_leaderboard_entries")
     @patch.object(NeptuneBackendMock, "download_file")
     @patch.object(NeptuneBackendMock, "download_file_set")
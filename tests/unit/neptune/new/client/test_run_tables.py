@@ -14,13 +14,18 @@
 # limitations under the License.
 #
 
+import gc
+import time
 import unittest
+import uuid
+import weakref
 from typing import List
 
 from mock import patch
 
 from neptune import init_project
 from neptune.exceptions import NeptuneException
+from neptune.internal.backends.api_model import LeaderboardEntry
 from neptune.internal.backends.neptune_backend_mock import NeptuneBackendMock
 from neptune.internal.container_type import ContainerType
 from neptune.metadata_containers.metadata_containers_table import (
@@ -56,3 +61,136 @@ class TestRunTables(AbstractTablesTestMixin, unittest.TestCase):
                 with self.assertRaises(NeptuneException) as context:
                     self.get_table(state=incorrect_state)
                 self.assertEquals(f"Can't map RunState to API: {incorrect_state}", str(context.exception))
+
+    @patch("neptune.internal.backends.factory.HostedNeptuneBackend", NeptuneBackendMock)
+    @patch.object(NeptuneBackendMock, "search_leaderboard_entries")
+    def test_fetch_runs_table_pushes_filters_to_backend_query(self, search_leaderboard_entries):
+        # when
+        self.get_table(id=["RUN-1", "RUN-2"], state="active", owner="user1", tag=["tag1", "tag2"])
+
+        # then
+        self.assertEqual(1, search_leaderboard_entries.call_count)
+        parameters = search_leaderboard_entries.call_args[1]
+        self.assertEqual(
+            "((`sys/trashed`:bool = false)"
+            ' AND ((`sys/id`:string = "RUN-1") OR (`sys/id`:string = "RUN-2"))'
+            ' AND ((`sys/state`:experimentState = "running"))'
+            ' AND ((`sys/owner`:string = "user1"))'
+            ' AND ((`sys/tags`:stringSet CONTAINS "tag1") AND (`sys/tags`:stringSet CONTAINS "tag2")))',
+            str(parameters.get("query")),
+        )
+
+    @patch("neptune.internal.backends.factory.HostedNeptuneBackend", NeptuneBackendMock)
+    @patch.object(NeptuneBackendMock, "search_leaderboard_entries")
+    def test_fetch_runs_table_skips_repeated_tags(self, search_leaderboard_entries):
+        # when
+        self.get_table(tag=["tag1", "tag2", "tag1"])
+
+        # then
+        parameters = search_leaderboard_entries.call_args[1]
+        self.assertEqual(
+            "((`sys/trashed`:bool = false)"
+            ' AND ((`sys/tags`:stringSet CONTAINS "tag1") AND (`sys/tags`:stringSet CONTAINS "tag2")))',
+            str(parameters.get("query")),
+        )
+
+    @patch("neptune.internal.backends.factory.HostedNeptuneBackend", NeptuneBackendMock)
+    @patch.object(NeptuneBackendMock, "search_leaderboard_entries")
+    def test_fetch_runs_table_reuses_recently_fetched_table(self, search_leaderboard_entries):
+        # given
+        project = init_project(project="organization/project", mode="read-only")
+
+        # when
+        table = project.fetch_runs_table(tag=["tag1", "tag2"])
+
+        # then
+        self.assertIs(table, project.fetch_runs_table(tag=["tag2", "tag1"]))
+        self.assertIs(table, project.fetch_runs_table(tag=["tag2", "tag1", "tag2"]))
+        self.assertEqual(1, search_leaderboard_entries.call_count)
+
+        # and
+        self.assertIsNot(table, project.fetch_runs_table(tag=["tag1"]))
+        self.assertEqual(2, search_leaderboard_entries.call_count)
+
+        # and
+        self.assertIsNot(table, project.fetch_runs_table(tag=["tag1", "tag2"], force_refresh=True))
+        self.assertEqual(3, search_leaderboard_entries.call_count)
+
+    @patch("neptune.internal.backends.factory.HostedNeptuneBackend", NeptuneBackendMock)
+    @patch.object(NeptuneBackendMock, "search_leaderboard_entries")
+    def test_fetch_runs_table_cache_expires(self, search_leaderboard_entries):
+        # given
+        project = init_project(project="organization/project", mode="read-only")
+        table = project.fetch_runs_table()
+
+        # when
+        with patch("neptune.metadata_containers.project.monotonic", return_value=time.monotonic() + 61):
+            self.assertIsNot(table, project.fetch_runs_table())
+
+        # then
+        self.assertEqual(2, search_leaderboard_entries.call_count)
+
+    @patch("neptune.internal.backends.factory.HostedNeptuneBackend", NeptuneBackendMock)
+    @patch.object(NeptuneBackendMock, "search_leaderboard_entries")
+    def test_fetch_runs_table_drops_expired_tables(self, search_leaderboard_entries):
+        # given
+        project = init_project(project="organization/project", mode="read-only")
+        tables = [project.fetch_runs_table(tag="tag1"), project.fetch_runs_table(tag="tag2")]
+
+        # when
+        with patch("neptune.metadata_containers.project.monotonic", return_value=time.monotonic() + 61):
+            self.assertIsNot(tables[0], project.fetch_runs_table(tag="tag1"))
+
+        # then
+        self.assertEqual(1, len(project._runs_table_cache))
+
+    @patch("neptune.internal.backends.factory.HostedNeptuneBackend", NeptuneBackendMock)
+    @patch.object(NeptuneBackendMock, "search_leaderboard_entries")
+    def test_fetch_runs_table_does_not_keep_dropped_table(self, search_leaderboard_entries):
+        # given
+        search_leaderboard_entries.side_effect = lambda *args, **kwargs: [
+            LeaderboardEntry(str(uuid.uuid4()), []) for _ in range(10)
+        ]
+        project = init_project(project="organization/project", mode="read-only")
+        table = project.fetch_runs_table()
+        table.to_rows()
+        table_ref = weakref.ref(table)
+
+        # when
+        del table
+        gc.collect()
+
+        # then
+        self.assertIsNone(table_ref())
+        project.fetch_runs_table()
+        self.assertEqual(2, search_leaderboard_entries.call_count)
+
+    @patch("neptune.internal.backends.factory.HostedNeptuneBackend", NeptuneBackendMock)
+    @patch.object(NeptuneBackendMock, "search_leaderboard_entries")
+    def test_fetch_runs_table_does_not_reuse_failed_table(self, search_leaderboard_entries):
+        # given
+        def entries():
+            raise NeptuneException("Connection lost")
+            yield
+
+        search_leaderboard_entries.side_effect = lambda *args, **kwargs: entries()
+        project = init_project(project="organization/project", mode="read-only")
+        table = project.fetch_runs_table()
+        with self.assertRaises(NeptuneException):
+            table.to_rows()
+
+        # when
+        project.fetch_runs_table()
+
+        # then
+        self.assertEqual(2, search_leaderboard_entries.call_count)
+
+    @patch("neptune.internal.backends.factory.HostedNeptuneBackend", NeptuneBackendMock)
+    @patch.object(NeptuneBackendMock, "search_leaderboard_entries")
+    def test_fetch_runs_table_accepts_columns_generator(self, search_leaderboard_entries):
+        # when
+        self.get_table(columns=(column for column in ["params/lr", "params/batch_size"]))
+
+        # then
+        parameters = search_leaderboard_entries.call_args[1]
+        self.assertEqual({"sys/id", "params/lr", "params/batch_size"}, set(parameters.get("columns")))
@@ -17,6 +17,7 @@ import socket
 import time
 import unittest
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from unittest.mock import (
     Mock,
@@ -43,6 +44,7 @@ from neptune.exceptions import (
     MetadataInconsistency,
     NeptuneClientUpgradeRequiredError,
     NeptuneLimitExceedException,
+    ProjectNotFound,
 )
 from neptune.internal.backends.hosted_client import (
     DEFAULT_REQUEST_KWARGS,
@@ -700,3 +702,188 @@ class TestHostedNeptuneBackend(unittest.TestCase, BackendTestMixin):
         # then
         with pytest.raises(FileSetNotFound):
             backend.list_fileset_files(["mock"], "mock", ".")
+
+    @patch("socket.gethostbyname", MagicMock(return_value="1.1.1.1"))
+    def test_search_leaderboard_entries_project_not_found(self, swagger_client_factory):
+        # given
+        self._get_swagger_client_mock(swagger_client_factory)
+        backend = HostedNeptuneBackend(credentials)
+        mock_leaderboard_client = MagicMock()
+        mock_leaderboard_client.api.searchLeaderboardEntries.side_effect = HTTPNotFound(response_mock())
+
+        backend.leaderboard_client = mock_leaderboard_client
+
+        # then
+        with pytest.raises(ProjectNotFound):
+            backend.search_leaderboard_entries(project_id="project", types=[ContainerType.RUN])
+
+    @patch.dict("os.environ", {"NEPTUNE_FETCH_TABLE_STEP_SIZE": "2"})
+    @patch("socket.gethostbyname", MagicMock(return_value="1.1.1.1"))
+    def test_search_leaderboard_entries_fetches_pages_lazily(self, swagger_client_factory):
+        # given
+        self._get_swagger_client_mock(swagger_client_factory)
+        backend = HostedNeptuneBackend(credentials)
+        mock_leaderboard_client = MagicMock()
+        backend.leaderboard_client = mock_leaderboard_client
+
+        # and
+        entries = [MagicMock(experimentId=f"id-{i}", attributes=[]) for i in range(5)]
+
+        def search_leaderboard_entries(params, **_):
+            offset, limit = params["pagination"]["offset"], params["pagination"]["limit"]
+            response = MagicMock()
+            response.response.return_value.result.entries = entries[offset : offset + limit]
+            response.response.return_value.result.matchingItemCount = len(entries)
+            return response
+
+        mock_leaderboard_client.api.searchLeaderboardEntries.side_effect = search_leaderboard_entries
+
+        # when
+        result = backend.search_leaderboard_entries(project_id="project", types=[ContainerType.RUN])
+
+        # then
+        self.assertEqual(1, mock_leaderboard_client.api.searchLeaderboardEntries.call_count)
+        self.assertEqual("id-0", next(result).id)
+        self.assertEqual("id-1", next(result).id)
+        self.assertEqual(1, mock_leaderboard_client.api.searchLeaderboardEntries.call_count)
+        self.assertEqual(["id-2", "id-3", "id-4"], [entry.id for entry in result])
+        self.assertEqual(3, mock_leaderboard_client.api.searchLeaderboardEntries.call_count)
+
+    @patch.dict("os.environ", {"NEPTUNE_FETCH_TABLE_STEP_SIZE": "2", "NEPTUNE_FETCH_TABLE_MAX_WORKERS": "2"})
+    @patch("socket.gethostbyname", MagicMock(return_value="1.1.1.1"))
+    def test_search_leaderboard_entries_fetches_pages_concurrently(self, swagger_client_factory):
+        # given
+        self._get_swagger_client_mock(swagger_client_factory)
+        backend = HostedNeptuneBackend(credentials)
+        mock_leaderboard_client = MagicMock()
+        backend.leaderboard_client = mock_leaderboard_client
+
+        # and
+        entries = [MagicMock(experimentId=f"id-{i}", attributes=[]) for i in range(9)]
+        requested_offsets = []
+
+        def search_leaderboard_entries(params, **_):
+            offset, limit = params["pagination"]["offset"], params["pagination"]["limit"]
+            requested_offsets.append(offset)
+            # later pages respond faster, so completion order differs from page order
+            time.sleep(0.05 / (offset + 1))
+            response = MagicMock()
+            response.response.return_value.result.entries = entries[offset : offset + limit]
+            response.response.return_value.result.matchingItemCount = len(entries)
+            return response
+
+        mock_leaderboard_client.api.searchLeaderboardEntries.side_effect = search_leaderboard_entries
+
+        # when
+        result = list(backend.search_leaderboard_entries(project_id="project", types=[ContainerType.RUN]))
+
+        # then
+        self.assertEqual([f"id-{i}" for i in range(9)], [entry.id for entry in result])
+        self.assertEqual([0, 2, 4, 6, 8], sorted(requested_offsets))
+
+    @patch.dict("os.environ", {"NEPTUNE_FETCH_TABLE_STEP_SIZE": "2", "NEPTUNE_FETCH_TABLE_MAX_WORKERS": "2"})
+    @patch("socket.gethostbyname", MagicMock(return_value="1.1.1.1"))
+    def test_search_leaderboard_entries_holds_no_threads_between_pages(self, swagger_client_factory):
+        # given
+        self._get_swagger_client_mock(swagger_client_factory)
+        backend = HostedNeptuneBackend(credentials)
+        mock_leaderboard_client = MagicMock()
+        backend.leaderboard_client = mock_leaderboard_client
+
+        # and
+        entries = [MagicMock(experimentId=f"id-{i}", attributes=[]) for i in range(9)]
+
+        def search_leaderboard_entries(params, **_):
+            offset, limit = params["pagination"]["offset"], params["pagination"]["limit"]
+            response = MagicMock()
+            response.response.return_value.result.entries = entries[offset : offset + limit]
+            response.response.return_value.result.matchingItemCount = len(entries)
+            return response
+
+        mock_leaderboard_client.api.searchLeaderboardEntries.side_effect = search_leaderboard_entries
+
+        # and
+        executors = []
+
+        class RecordingExecutor(ThreadPoolExecutor):
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+                self.is_shut_down = False
+                executors.append(self)
+
+            def shutdown(self, *args, **kwargs):
+                super().shutdown(*args, **kwargs)
+                self.is_shut_down = True
+
+        # when
+        with patch("neptune.internal.backends.hosted_neptune_backend.ThreadPoolExecutor", RecordingExecutor):
+            result = backend.search_leaderboard_entries(project_id="project", types=[ContainerType.RUN])
+            for expected_id in [f"id-{i}" for i in range(9)]:
+                # then
+                self.assertEqual(expected_id, next(result).id)
+                self.assertTrue(all(executor.is_shut_down for executor in executors))
+
+        # and
+        self.assertEqual(2, len(executors))
+
+    @patch("socket.gethostbyname", MagicMock(return_value="1.1.1.1"))
+    def test_search_leaderboard_entries_deduplicates_strings(self, swagger_client_factory):
+        # given
+        self._get_swagger_client_mock(swagger_client_factory)
+        backend = HostedNeptuneBackend(credentials)
+        mock_leaderboard_client = MagicMock()
+        backend.leaderboard_client = mock_leaderboard_client
+
+        # and
+        def build_entry(experiment_id):
+            tags = MagicMock(type="stringSet")
+            tags.name = "".join(["sys/", "tags"])
+            tags.__getitem__.return_value = MagicMock(values=["".join(["t", "ag"])])
+            owner = MagicMock(type="string")
+            owner.name = "".join(["sys/", "owner"])
+            owner.__getitem__.return_value = MagicMock(value="".join(["us", "er"]))
+            return MagicMock(experimentId=experiment_id, attributes=[tags, owner])
+
+        result = mock_leaderboard_client.api.searchLeaderboardEntries.return_value.response.return_value.result
+        result.entries = [build_entry("id-1"), build_entry("id-2")]
+        result.matchingItemCount = 2
+
+        # when
+        first, second = backend.search_leaderboard_entries(project_id="project", types=[ContainerType.RUN])
+
+        # then
+        for first_attribute, second_attribute in zip(first.attributes, second.attributes):
+            self.assertIs(first_attribute.path, second_attribute.path)
+        self.assertIs(first.attributes[0].properties.values[0], second.attributes[0].properties.values[0])
+        self.assertIs(first.attributes[1].properties.value, second.attributes[1].properties.value)
+
+    @patch("socket.gethostbyname", MagicMock(return_value="1.1.1.1"))
+    def test_search_leaderboard_entries_requests_only_given_columns(self, swagger_client_factory):
+        # given
+        self._get_swagger_client_mock(swagger_client_factory)
+        backend = HostedNeptuneBackend(credentials)
+        mock_leaderboard_client = MagicMock()
+        backend.leaderboard_client = mock_leaderboard_client
+
+        # and
+        result = mock_leaderboard_client.api.searchLeaderboardEntries.return_value.response.return_value.result
+        result.entries = []
+        result.matchingItemCount = 0
+
+        # when
+        list(
+            backend.search_leaderboard_entries(
+                project_id="project", types=[ContainerType.RUN], columns=["sys/id", "params/lr"]
+            )
+        )
+
+        # then
+        params = mock_leaderboard_client.api.searchLeaderboardEntries.call_args[1]["params"]
+        self.assertEqual([{"path": "sys/id"}, {"path": "params/lr"}], params["attributeFilters"])
+
+        # when
+        list(backend.search_leaderboard_entries(project_id="project", types=[ContainerType.RUN]))
+
+        # then
+        params = mock_leaderboard_client.api.searchLeaderboardEntries.call_args[1]["params"]
+        self.assertNotIn("attributeFilters", params)
@@ -14,10 +14,14 @@
 # limitations under the License.
 #
 
+import json
 import os
 import unittest
 
+from mock import patch
+
 from neptune.common.exceptions import NeptuneInvalidApiTokenException
+from neptune.constants import ANONYMOUS_API_TOKEN
 from neptune.envs import API_TOKEN_ENV_NAME
 from neptune.internal.credentials import Credentials
 
@@ -60,3 +64,16 @@ class TestCredentials(unittest.TestCase):
         # expect
         with self.assertRaises(NeptuneInvalidApiTokenException):
             Credentials.from_token()
+
+    @patch("neptune.internal.credentials.json.loads", wraps=json.loads)
+    def test_decode_token_once(self, loads):
+        # given
+        Credentials._api_token_to_dict.cache_clear()
+
+        # when
+        first = Credentials.from_token(ANONYMOUS_API_TOKEN)
+        second = Credentials.from_token(ANONYMOUS_API_TOKEN)
+
+        # then
+        self.assertEqual(first, second)
+        self.assertEqual(1, loads.call_count)
@@ -176,6 +176,51 @@ class TestDiskQueue(unittest.TestCase):
 
             queue.close()
 
+    def test_put_writes_in_batches(self):
+        with TemporaryDirectory() as dirpath:
+            queue = DiskQueue[TestDiskQueue.Obj](
+                Path(dirpath),
+                self._serializer,
+                self._deserializer,
+                threading.RLock(),
+            )
+            queue.MAX_PENDING_TIME_SECONDS = 60
+            last_put_version_file = Path(dirpath) / "last_put_version"
+
+            for i in range(1, DiskQueue.MAX_PENDING_OPERATIONS):
+                queue.put(TestDiskQueue.Obj(i, str(i)))
+
+            self.assertEqual(DiskQueue.MAX_PENDING_OPERATIONS - 1, queue.size())
+            self.assertEqual("", last_put_version_file.read_text())
+
+            queue.put(TestDiskQueue.Obj(DiskQueue.MAX_PENDING_OPERATIONS, "last"))
+
+            self.assertEqual(str(DiskQueue.MAX_PENDING_OPERATIONS), last_put_version_file.read_text())
+            queue.close()
+
+    def test_close_writes_pending_operations(self):
+        with TemporaryDirectory() as dirpath:
+            queue = DiskQueue[TestDiskQueue.Obj](
+                Path(dirpath),
+                self._serializer,
+                self._deserializer,
+                threading.RLock(),
+            )
+            queue.MAX_PENDING_TIME_SECONDS = 60
+            obj = TestDiskQueue.Obj(5, "test")
+            queue.put(obj)
+            queue.close()
+
+            queue = DiskQueue[TestDiskQueue.Obj](
+                Path(dirpath),
+                self._serializer,
+                self._deserializer,
+                threading.RLock(),
+            )
+            self.assertEqual(1, queue.size())
+            self.assertEqual(queue.get(), self.get_queue_element(obj, 1))
+            queue.close()
+
     @staticmethod
     def _serializer(obj: "TestDiskQueue.Obj") -> dict:
         return obj.__dict__
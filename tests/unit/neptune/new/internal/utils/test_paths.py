@@ -0,0 +1,35 @@
+#
+# Copyright (c) 2023, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import unittest
+
+from neptune.internal.utils.paths import parse_path
+
+
+class TestPaths(unittest.TestCase):
+    def test_parse_path(self):
+        self.assertEqual(["train", "loss"], parse_path("train/loss"))
+        self.assertEqual(["train", "loss"], parse_path("/train//loss/"))
+        self.assertEqual([], parse_path(""))
+
+    def test_parse_path_returns_new_list(self):
+        # when
+        path = parse_path("train/loss")
+        path.append("other")
+
+        # then
+        self.assertEqual(["train", "loss"], parse_path("train/loss"))
+        self.assertIsNot(parse_path("train/loss"), parse_path("train/loss"))
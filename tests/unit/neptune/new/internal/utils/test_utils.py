@@ -17,6 +17,7 @@
 import unittest
 
 from neptune.internal.utils import (
+    as_list,
     verify_collection_type,
     verify_type,
 )
@@ -47,3 +48,15 @@ class TestUtils(unittest.TestCase):
     def test_verify_collection_type_failed_element(self):
         with self.assertRaises(TypeError):
             verify_collection_type("arg", ["string", 3, "a", 4.0, 1], (int, str))
+
+    def test_as_list(self):
+        self.assertEqual([], as_list("arg", None))
+        self.assertEqual(["a"], as_list("arg", "a"))
+        self.assertEqual(["a", "b"], as_list("arg", ["a", "b"]))
+        self.assertEqual(("a", "b"), as_list("arg", ("a", "b")))
+
+    def test_as_list_failed(self):
+        with self.assertRaises(TypeError):
+            as_list("arg", 5)
+        with self.assertRaises(TypeError):
+            as_list("arg", ["a", 5])
@@ -20,6 +20,7 @@ from bokeh.plotting import figure
 from PIL import Image
 
 from neptune.types import (
+    Boolean,
     Datetime,
     File,
     Float,
@@ -44,6 +45,23 @@ class TestTypeCasting(TestAttributeBase):
             with self.subTest(msg=value):
                 self.assertEqual(value, cast_value(value))
 
+    def test_cast_builtin_subclasses(self):
+        class IntSubclass(int):
+            pass
+
+        data = [
+            (True, Boolean(True)),
+            (IntSubclass(3), Integer(3)),
+            (numpy.float32(0.5), Float(0.5)),
+            (numpy.int64(7), Float(7)),
+            (numpy.uint8(255), Float(255)),
+            (numpy.float16(1.5), Float(1.5)),
+            (numpy.str_("abc"), String("abc")),
+        ]
+        for simple_value, expected_value in data:
+            with self.subTest(msg=simple_value):
+                self.assertEqual(expected_value, cast_value(simple_value))
+
     def test_cats_simple_values(self):
         now = datetime.now().replace(microsecond=0)
 